@@ -4,18 +4,20 @@ from pathlib import Path
 from typing import Annotated
 
 from fastapi import Depends, HTTPException
-from runrms.api import RmsApiProxy
 
 from fmu_settings_api.services.rms import RmsService
-from fmu_settings_api.session import refresh_rms_session
+from fmu_settings_api.session import RmsSession, refresh_rms_session
 
 from .project import ProjectServiceDep
 from .session import ProjectSessionDep
 
+rms_service = RmsService()
+"""Stateless RmsService shared across requests."""
+
 
 async def get_rms_service() -> RmsService:
-    """Returns an RmsService instance."""
-    return RmsService()
+    """Returns the shared RmsService instance."""
+    return rms_service
 
 
 RmsServiceDep = Annotated[RmsService, Depends(get_rms_service)]
@@ -35,10 +37,10 @@ async def get_rms_project_path(project_service: ProjectServiceDep) -> Path:
 RmsProjectPathDep = Annotated[Path, Depends(get_rms_project_path)]
 
 
-async def get_opened_rms_project(
+async def get_opened_rms_session(
     project_session: ProjectSessionDep,
-) -> RmsApiProxy:
-    """Returns the opened RMS project from the session and refreshes its expiry."""
+) -> RmsSession:
+    """Returns the opened RMS session and refreshes its expiry."""
     if project_session.rms_session is None:
         raise HTTPException(
             status_code=400,
@@ -47,8 +49,7 @@ async def get_opened_rms_project(
             ),
         )
 
-    refreshed_rms_session = await refresh_rms_session(project_session)
-    return refreshed_rms_session.project
+    return await refresh_rms_session(project_session)
 
 
-RmsProjectDep = Annotated[RmsApiProxy, Depends(get_opened_rms_project)]
+RmsSessionDep = Annotated[RmsSession, Depends(get_opened_rms_session)]
@@ -78,25 +78,27 @@ class RmsService:
         Returns:
             list[RmsStratigraphicZone]: List of zones in the project
         """
+        rms_zones = rms_project.zones
         zone_columns: dict[str, list[str]] = {}
         api_version = Version(rms_project.__version__)
         if api_version >= MIN_RMS_API_VERSION_FOR_STRAT_COLUMNS:
-            for column_name in rms_project.zones.columns():
-                for zonename in rms_project.zones.column_zones(column_name):
+            for column_name in rms_zones.columns():
+                for zonename in rms_zones.column_zones(column_name):
                     zone_columns.setdefault(zonename, []).append(column_name)
 
         zones = []
-        for zone in rms_project.zones:
-            if (
-                zone.horizon_above.get() is not None
-                and zone.horizon_below.get() is not None
-            ):
+        for zone in rms_zones:
+            # Attribute access on the proxy builds a child proxy and each .get() is
+            # one round-trip to the RMS worker, so resolve each path once per zone.
+            horizon_above = zone.horizon_above
+            horizon_below = zone.horizon_below
+            if horizon_above.get() is not None and horizon_below.get() is not None:
                 zone_name = zone.name.get()
                 zones.append(
                     RmsStratigraphicZone(
                         name=zone_name,
-                        top_horizon_name=zone.horizon_above.name.get(),
-                        base_horizon_name=zone.horizon_below.name.get(),
+                        top_horizon_name=horizon_above.name.get(),
+                        base_horizon_name=horizon_below.name.get(),
                         stratigraphic_column_name=zone_columns.get(zone_name, [])
                         if zone_columns
                         else None,
@@ -1,8 +1,10 @@
 """Functionality for managing sessions."""
 
+import asyncio
+from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Self
+from typing import Any, Self, TypeVar
 from uuid import uuid4
 
 from fmu.settings import ProjectFMUDirectory, UserFMUDirectory
@@ -17,6 +19,22 @@ from fmu_settings_api.services.user import add_to_user_recent_projects
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+_project_lock_transition_locks: dict[str, asyncio.Lock] = {}
+"""Per-session locks serializing project lock acquire, release and refresh.
+
+Acquiring runs in a worker thread, so without these a concurrent request in the
+same session could release, re-acquire or replace the project lock between the
+check and the acquire. Kept out of the session dataclasses, which go through asdict().
+"""
+
+
+def _project_lock_transition_lock(session_id: str) -> asyncio.Lock:
+    """Returns the project lock transition lock for a session."""
+    return _project_lock_transition_locks.setdefault(session_id, asyncio.Lock())
+
 
 class SessionNotFoundError(ValueError):
     """Raised when getting a session id that does not exist."""
@@ -47,6 +65,18 @@ class RmsSession:
     """An opened RMS project that close() can be called against."""
     expires_at: datetime
     """Timestamp when the RMS session will expire."""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    """Serializes calls through this session's RMS API proxies."""
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs a blocking RMS API call in a worker thread.
+
+        The opened project proxy and its child proxies share the ZeroMQ REQ socket
+        of this session's executor, which must not be used from several threads at
+        once. Calls are therefore serialized per RMS session.
+        """
+        async with self.lock:
+            return await asyncio.to_thread(func, *args)
 
     def cleanup(self, session_id: str = "unknown") -> None:
         """Closes the RMS project and shuts down the executor."""
@@ -129,27 +159,33 @@ class SessionManager:
 
     async def destroy_session(self: Self, session_id: str) -> None:
         """Destroys a session by its session id."""
-        session = await self._retrieve_session(session_id)
-        if session is None:
-            return
-
-        if isinstance(session, ProjectSession):
-            try:
-                session.project_fmu_directory._lock.release()
-            except Exception as e:
-                session.lock_errors.release = str(e)
-                logger.error(
-                    "destroy_session_release_lock",
-                    session_id=session_id,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-
-            if session.rms_session is not None:
-                session.rms_session.cleanup(session_id)
+        rms_session: RmsSession | None = None
+        async with _project_lock_transition_lock(session_id):
+            session = await self._retrieve_session(session_id)
+            if session is None:
+                return
+
+            if isinstance(session, ProjectSession):
+                try:
+                    session.project_fmu_directory._lock.release()
+                except Exception as e:
+                    session.lock_errors.release = str(e)
+                    logger.error(
+                        "destroy_session_release_lock",
+                        session_id=session_id,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+
+                rms_session = session.rms_session
                 session.rms_session = None
 
-        del self.storage[session_id]
+            del self.storage[session_id]
+            _project_lock_transition_locks.pop(session_id, None)
+
+        # Closing RMS can take a while; do it without holding the transition lock
+        if rms_session is not None:
+            await rms_session.run(rms_session.cleanup, session_id)
 
     async def create_session(
         self: Self,
@@ -203,6 +239,9 @@ class SessionManager:
         session.expires_at = now + timedelta(seconds=expire_seconds)
 
         del self.storage[session_id]
+        transition_lock = _project_lock_transition_locks.pop(session_id, None)
+        if transition_lock is not None:
+            _project_lock_transition_locks[new_session_id] = transition_lock
         await self._store_session(new_session_id, session)
         return session
 
@@ -307,42 +346,47 @@ async def add_fmu_project_to_session(
     Raises:
         SessionNotFoundError: If no valid session was found
     """
-    session = await get_fmu_session(session_id)
+    rms_session: RmsSession | None = None
+    async with _project_lock_transition_lock(session_id):
+        session = await get_fmu_session(session_id)
+
+        lock_errors = LockErrors()
 
-    lock_errors = LockErrors()
+        if isinstance(session, ProjectSession):
+            try:
+                session.project_fmu_directory._lock.release()
+            except Exception as e:
+                lock_errors.release = str(e)
+
+            rms_session = session.rms_session
+            session.rms_session = None
 
-    if isinstance(session, ProjectSession):
         try:
-            session.project_fmu_directory._lock.release()
+            # Acquiring writes and fsyncs the lock file; keep it off the event loop
+            await asyncio.to_thread(project_fmu_directory._lock.acquire)
         except Exception as e:
-            lock_errors.release = str(e)
+            lock_errors.acquire = str(e)
 
-        if session.rms_session is not None:
-            session.rms_session.cleanup(session_id)
-            session.rms_session = None
+        lock_errors.refresh = None
 
-    try:
-        project_fmu_directory._lock.acquire()
-    except Exception as e:
-        lock_errors.acquire = str(e)
-
-    lock_errors.refresh = None
-
-    if isinstance(session, ProjectSession):
-        project_session = session
-        project_session.project_fmu_directory = project_fmu_directory
-        project_session.lock_errors = lock_errors
-    else:
-        project_session = ProjectSession(
-            **asdict(session),
-            project_fmu_directory=project_fmu_directory,
-            lock_errors=lock_errors,
+        if isinstance(session, ProjectSession):
+            project_session = session
+            project_session.project_fmu_directory = project_fmu_directory
+            project_session.lock_errors = lock_errors
+        else:
+            project_session = ProjectSession(
+                **asdict(session),
+                project_fmu_directory=project_fmu_directory,
+                lock_errors=lock_errors,
+            )
+        add_to_user_recent_projects(
+            project_path=project_fmu_directory.base_path,
+            user_dir=project_session.user_fmu_directory,
         )
-    add_to_user_recent_projects(
-        project_path=project_fmu_directory.base_path,
-        user_dir=project_session.user_fmu_directory,
-    )
-    await update_fmu_session(project_session)
+        await update_fmu_session(project_session)
+
+    if rms_session is not None:
+        await rms_session.run(rms_session.cleanup, session_id)
     return project_session
 
 
@@ -373,22 +417,23 @@ async def try_acquire_project_lock(session_id: str) -> ProjectSession:
     Raises:
         SessionNotFoundError: If no valid session or project is found
     """
-    session = await get_fmu_session(session_id)
+    async with _project_lock_transition_lock(session_id):
+        session = await get_fmu_session(session_id)
 
-    if not isinstance(session, ProjectSession):
-        raise SessionNotFoundError("No FMU project directory open")
+        if not isinstance(session, ProjectSession):
+            raise SessionNotFoundError("No FMU project directory open")
 
-    lock = session.project_fmu_directory._lock
+        lock = session.project_fmu_directory._lock
 
-    try:
-        if not lock.is_acquired():
-            lock.acquire()
-            session.lock_errors.acquire = None
-    except Exception as e:
-        session.lock_errors.acquire = str(e)
+        try:
+            if not lock.is_acquired():
+                await asyncio.to_thread(lock.acquire)
+                session.lock_errors.acquire = None
+        except Exception as e:
+            session.lock_errors.acquire = str(e)
 
-    await update_fmu_session(session)
-    return session
+        await update_fmu_session(session)
+        return session
 
 
 async def release_project_lock(session_id: str) -> ProjectSession:
@@ -400,22 +445,23 @@ async def release_project_lock(session_id: str) -> ProjectSession:
     Raises:
         SessionNotFoundError: If no valid session or project is found
     """
-    session = await get_fmu_session(session_id)
+    async with _project_lock_transition_lock(session_id):
+        session = await get_fmu_session(session_id)
 
-    if not isinstance(session, ProjectSession):
-        raise SessionNotFoundError("No FMU project directory open")
+        if not isinstance(session, ProjectSession):
+            raise SessionNotFoundError("No FMU project directory open")
 
-    lock = session.project_fmu_directory._lock
+        lock = session.project_fmu_directory._lock
 
-    try:
-        if lock.is_acquired():
-            lock.release()
-            session.lock_errors.release = None
-    except Exception as e:
-        session.lock_errors.release = str(e)
+        try:
+            if lock.is_acquired():
+                lock.release()
+                session.lock_errors.release = None
+        except Exception as e:
+            session.lock_errors.release = str(e)
 
-    await update_fmu_session(session)
-    return session
+        await update_fmu_session(session)
+        return session
 
 
 async def refresh_project_lock(session_id: str) -> ProjectSession:
@@ -429,21 +475,22 @@ async def refresh_project_lock(session_id: str) -> ProjectSession:
     Raises:
         SessionNotFoundError: If no valid session or project is found
     """
-    session = await get_fmu_session(session_id)
+    async with _project_lock_transition_lock(session_id):
+        session = await get_fmu_session(session_id)
 
-    if not isinstance(session, ProjectSession):
-        raise SessionNotFoundError("No FMU project directory open")
+        if not isinstance(session, ProjectSession):
+            raise SessionNotFoundError("No FMU project directory open")
 
-    lock = session.project_fmu_directory._lock
-    try:
-        if lock.is_acquired():
-            lock.refresh()
-        session.lock_errors.refresh = None
-    except Exception as e:
-        session.lock_errors.refresh = str(e)
+        lock = session.project_fmu_directory._lock
+        try:
+            if lock.is_acquired():
+                lock.refresh()
+            session.lock_errors.refresh = None
+        except Exception as e:
+            session.lock_errors.refresh = str(e)
 
-    await update_fmu_session(session)
-    return session
+        await update_fmu_session(session)
+        return session
 
 
 async def remove_fmu_project_from_session(session_id: str) -> Session:
@@ -455,28 +502,31 @@ async def remove_fmu_project_from_session(session_id: str) -> Session:
     Raises:
         SessionNotFoundError: If no valid session was found
     """
-    maybe_project_session = await get_fmu_session(session_id)
+    async with _project_lock_transition_lock(session_id):
+        maybe_project_session = await get_fmu_session(session_id)
 
-    if not isinstance(maybe_project_session, ProjectSession):
-        return maybe_project_session
+        if not isinstance(maybe_project_session, ProjectSession):
+            return maybe_project_session
 
-    try:
-        maybe_project_session.project_fmu_directory._lock.release()
-        maybe_project_session.lock_errors.release = None
-    except Exception as e:
-        maybe_project_session.lock_errors.release = str(e)
+        try:
+            maybe_project_session.project_fmu_directory._lock.release()
+            maybe_project_session.lock_errors.release = None
+        except Exception as e:
+            maybe_project_session.lock_errors.release = str(e)
 
-    if maybe_project_session.rms_session is not None:
-        maybe_project_session.rms_session.cleanup(session_id)
+        rms_session = maybe_project_session.rms_session
         maybe_project_session.rms_session = None
 
-    project_session_dict = asdict(maybe_project_session)
-    project_session_dict.pop("project_fmu_directory", None)
-    project_session_dict.pop("lock_errors", None)
-    project_session_dict.pop("rms_session", None)
+        project_session_dict = asdict(maybe_project_session)
+        project_session_dict.pop("project_fmu_directory", None)
+        project_session_dict.pop("lock_errors", None)
+        project_session_dict.pop("rms_session", None)
 
-    session = Session(**project_session_dict)
-    await update_fmu_session(session)
+        session = Session(**project_session_dict)
+        await update_fmu_session(session)
+
+    if rms_session is not None:
+        await rms_session.run(rms_session.cleanup, session_id)
     return session
 
 
@@ -496,8 +546,7 @@ async def add_rms_project_to_session(
     if not isinstance(session, ProjectSession):
         raise SessionNotFoundError("No FMU project directory open")
 
-    if session.rms_session is not None:
-        session.rms_session.cleanup(session_id)
+    previous_rms_session = session.rms_session
 
     rms_expires_at = datetime.now(UTC) + timedelta(
         seconds=settings.RMS_SESSION_EXPIRE_SECONDS
@@ -506,6 +555,9 @@ async def add_rms_project_to_session(
         executor=executor, project=rms_project, expires_at=rms_expires_at
     )
     await update_fmu_session(session)
+
+    if previous_rms_session is not None:
+        await previous_rms_session.run(previous_rms_session.cleanup, session_id)
     return session
 
 
@@ -526,12 +578,13 @@ async def remove_rms_project_from_session(session_id: str) -> ProjectSession:
     if not isinstance(session, ProjectSession):
         raise SessionNotFoundError("No FMU project directory open")
 
-    if session.rms_session is not None:
-        session.rms_session.cleanup(session_id)
-
+    rms_session = session.rms_session
     session.rms_session = None
 
     await update_fmu_session(session)
+
+    if rms_session is not None:
+        await rms_session.run(rms_session.cleanup, session_id)
     return session
 
 
@@ -1,5 +1,6 @@
 """Routes for interacting with RMS projects."""
 
+import asyncio
 from textwrap import dedent
 from typing import Final
 
@@ -15,9 +16,9 @@ from runrms.exceptions import RmsProjectNotFoundError, RmsVersionError
 
 from fmu_settings_api.deps import SessionServiceDep
 from fmu_settings_api.deps.rms import (
-    RmsProjectDep,
     RmsProjectPathDep,
     RmsServiceDep,
+    RmsSessionDep,
 )
 from fmu_settings_api.models.common import Message
 from fmu_settings_api.models.rms import RmsVersion
@@ -135,8 +136,12 @@ async def post_rms_project(
         )
     try:
         if version is None:
-            version = rms_service.get_rms_version(rms_project_path)
-        executor, project = rms_service.open_rms_project(rms_project_path, version)
+            version = await asyncio.to_thread(
+                rms_service.get_rms_version, rms_project_path
+            )
+        executor, project = await asyncio.to_thread(
+            rms_service.open_rms_project, rms_project_path, version
+        )
         await session_service.add_rms_session(executor, project)
         return Message(
             message=f"RMS project opened successfully with RMS version {version}."
@@ -208,14 +213,14 @@ async def delete_rms_project(session_service: SessionServiceDep) -> Message:
 )
 async def get_zones(
     rms_service: RmsServiceDep,
-    opened_rms_project: RmsProjectDep,
+    rms_session: RmsSessionDep,
 ) -> list[RmsStratigraphicZone]:
     """Retrieve the zones from the currently open RMS project.
 
     This endpoint requires an RMS project to be open in the session.
     Use the POST / endpoint first to open an RMS project.
     """
-    return rms_service.get_zones(opened_rms_project)
+    return await rms_session.run(rms_service.get_zones, rms_session.project)
 
 
 @router.get(
@@ -229,14 +234,14 @@ async def get_zones(
 )
 async def get_horizons(
     rms_service: RmsServiceDep,
-    opened_rms_project: RmsProjectDep,
+    rms_session: RmsSessionDep,
 ) -> list[RmsHorizon]:
     """Retrieve all horizons from the currently open RMS project.
 
     This endpoint requires an RMS project to be open in the session.
     Use the POST / endpoint first to open an RMS project.
     """
-    return rms_service.get_horizons(opened_rms_project)
+    return await rms_session.run(rms_service.get_horizons, rms_session.project)
 
 
 @router.get(
@@ -250,14 +255,14 @@ async def get_horizons(
 )
 async def get_wells(
     rms_service: RmsServiceDep,
-    opened_rms_project: RmsProjectDep,
+    rms_session: RmsSessionDep,
 ) -> list[RmsWell]:
     """Retrieve all wells from the currently open RMS project.
 
     This endpoint requires an RMS project to be open in the session.
     Use the POST / endpoint first to open an RMS project.
     """
-    return rms_service.get_wells(opened_rms_project)
+    return await rms_session.run(rms_service.get_wells, rms_session.project)
 
 
 @router.get(
@@ -271,11 +276,11 @@ async def get_wells(
 )
 async def get_coordinate_system(
     rms_service: RmsServiceDep,
-    opened_rms_project: RmsProjectDep,
+    rms_session: RmsSessionDep,
 ) -> RmsCoordinateSystem:
     """Retrieve the project coordinate system from the currently open RMS project.
 
     This endpoint requires an RMS project to be open in the session.
     Use the POST / endpoint first to open an RMS project.
     """
-    return rms_service.get_coordinate_system(opened_rms_project)
+    return await rms_session.run(rms_service.get_coordinate_system, rms_session.project)
@@ -1,5 +1,6 @@
 """Root configuration for pytest."""
 
+import asyncio
 import json
 import stat
 from collections.abc import AsyncGenerator, Callable, Generator, Iterator
@@ -285,6 +286,21 @@ def no_permissions() -> Callable[[str | Path], AbstractContextManager[None]]:
     return ctx_manager
 
 
+@pytest.fixture
+def assert_off_event_loop() -> Callable[..., None]:
+    """Returns a callable that fails if called on a thread running an event loop."""
+
+    def _assert_off_event_loop(*args: Any, **kwargs: Any) -> None:
+        """Raises an AssertionError when an event loop is running in this thread."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise AssertionError("Blocking call was made on the event loop thread")
+
+    return _assert_off_event_loop
+
+
 @pytest.fixture
 def user_fmu_dir_no_permissions(fmu_dir_path: Path) -> Generator[Path]:
     """Mocks a user .fmu tmp_path without permissions."""
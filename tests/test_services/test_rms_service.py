@@ -10,6 +10,7 @@ from fmu.settings.models.project_config import (
     RmsStratigraphicZone,
     RmsWell,
 )
+from pydantic import ValidationError
 from runrms.exceptions import RmsProjectNotFoundError, RmsVersionError
 
 from fmu_settings_api.services.rms import RmsService
@@ -238,6 +239,31 @@ def test_get_horizons(rms_service: RmsService, mock_rms_proxy: MagicMock) -> Non
     assert [h.type for h in horizons] == ["calculated", "interpreted"]
 
 
+def test_get_horizons_invalid_type(
+    rms_service: RmsService, mock_rms_proxy: MagicMock
+) -> None:
+    """Test that a horizon type unknown to the model is rejected."""
+    horizon = MagicMock()
+    horizon.name.get.return_value = "H1"
+    horizon.type.name.get.return_value = "bogus"
+    mock_rms_proxy.horizons = [horizon]
+
+    with pytest.raises(ValidationError):
+        rms_service.get_horizons(mock_rms_proxy)
+
+
+def test_get_wells_invalid_name(
+    rms_service: RmsService, mock_rms_proxy: MagicMock
+) -> None:
+    """Test that a well without a name is rejected."""
+    well = MagicMock()
+    well.name.get.return_value = None
+    mock_rms_proxy.wells = [well]
+
+    with pytest.raises(ValidationError):
+        rms_service.get_wells(mock_rms_proxy)
+
+
 def test_get_wells(rms_service: RmsService, mock_rms_proxy: MagicMock) -> None:
     """Test retrieving wells."""
     well_1 = MagicMock()
@@ -1,7 +1,9 @@
 """Tests the SessionManager functionality."""
 
+import asyncio
+import threading
+import time
 from collections.abc import Callable
-from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -259,10 +261,10 @@ class TestSessionManagerClass:
         """Tests getting an existing session updates its last accessed."""
         user_fmu_dir = init_user_fmu_directory()
         session_id = await session_manager.create_session(user_fmu_dir)
-        orig_session = deepcopy(session_manager.storage[session_id])
+        orig_last_accessed = session_manager.storage[session_id].last_accessed
         session = await session_manager.get_session(session_id)
         assert session is not None
-        assert orig_session.last_accessed < session.last_accessed
+        assert orig_last_accessed < session.last_accessed
 
     async def test_renew_existing_session(
         self, session_manager: SessionManager, tmp_path_mocked_home: Path
@@ -270,8 +272,8 @@ class TestSessionManagerClass:
         """Tests renewing an existing session rotates its id and timestamps."""
         user_fmu_dir = init_user_fmu_directory()
         session_id = await session_manager.create_session(user_fmu_dir)
-        original_session = deepcopy(session_manager.storage[session_id])
-        accessed_at = original_session.last_accessed + timedelta(seconds=1)
+        orig_last_accessed = session_manager.storage[session_id].last_accessed
+        accessed_at = orig_last_accessed + timedelta(seconds=1)
         renewed_at = accessed_at + timedelta(seconds=1)
 
         with patch("fmu_settings_api.session.datetime") as datetime_mock:
@@ -509,6 +511,30 @@ async def test_add_fmu_project_to_session_acquires_lock(
     mock_lock.acquire.assert_called_once()
 
 
+async def test_add_fmu_project_to_session_acquires_lock_off_event_loop(
+    session_manager: SessionManager,
+    tmp_path_mocked_home: Path,
+    init_project_fmu_directory: Callable[[Path], ProjectFMUDirectory],
+    assert_off_event_loop: Callable[..., None],
+) -> None:
+    """Tests that the lock is acquired outside the event loop thread."""
+    user_fmu_dir = init_user_fmu_directory()
+    session_id = await create_fmu_session(user_fmu_dir)
+
+    project_path = tmp_path_mocked_home / "test_project"
+    project_fmu_dir = init_project_fmu_directory(project_path)
+
+    mock_lock = Mock()
+    mock_lock.acquire.side_effect = assert_off_event_loop
+    project_fmu_dir._lock = mock_lock
+
+    with patch("fmu_settings_api.session.session_manager", session_manager):
+        project_session = await add_fmu_project_to_session(session_id, project_fmu_dir)
+
+    mock_lock.acquire.assert_called_once()
+    assert project_session.lock_errors.acquire is None
+
+
 async def test_add_fmu_project_to_session_releases_previous_lock(
     session_manager: SessionManager,
     tmp_path_mocked_home: Path,
@@ -674,6 +700,91 @@ async def test_add_access_token_to_session_with_invalid_token(
         await add_access_token_to_session(session_id, token)
 
 
+async def test_try_acquire_project_lock_concurrent_calls(
+    session_manager: SessionManager,
+    tmp_path_mocked_home: Path,
+    init_project_fmu_directory: Callable[[Path], ProjectFMUDirectory],
+) -> None:
+    """Tests that concurrent acquires on one session do not race each other."""
+    user_fmu_dir = init_user_fmu_directory()
+    project_fmu_dir = init_project_fmu_directory(tmp_path_mocked_home / "project")
+
+    with patch("fmu_settings_api.session.session_manager", session_manager):
+        session_id = await create_fmu_session(user_fmu_dir)
+        await add_fmu_project_to_session(session_id, project_fmu_dir)
+        await release_project_lock(session_id)
+        assert not project_fmu_dir._lock.is_acquired()
+
+        await asyncio.gather(
+            try_acquire_project_lock(session_id),
+            try_acquire_project_lock(session_id),
+        )
+        session = await get_fmu_session(session_id)
+
+    assert isinstance(session, ProjectSession)
+    assert project_fmu_dir._lock.is_acquired()
+    assert session.lock_errors.acquire is None
+
+
+async def test_add_fmu_project_to_session_concurrent_opens_release_replaced_lock(
+    session_manager: SessionManager,
+    tmp_path_mocked_home: Path,
+    init_project_fmu_directory: Callable[[Path], ProjectFMUDirectory],
+) -> None:
+    """Tests that concurrent project opens on one session leave no orphaned lock."""
+    user_fmu_dir = init_user_fmu_directory()
+    project_a = init_project_fmu_directory(tmp_path_mocked_home / "project_a")
+    project_b = init_project_fmu_directory(tmp_path_mocked_home / "project_b")
+
+    with patch("fmu_settings_api.session.session_manager", session_manager):
+        session_id = await create_fmu_session(user_fmu_dir)
+        await asyncio.gather(
+            add_fmu_project_to_session(session_id, project_a),
+            add_fmu_project_to_session(session_id, project_b),
+        )
+        session = await get_fmu_session(session_id)
+
+    assert isinstance(session, ProjectSession)
+    open_dir = session.project_fmu_directory
+    other_dir = project_b if open_dir is project_a else project_a
+    assert open_dir._lock.is_acquired()
+    assert not other_dir._lock.is_acquired()
+    assert not other_dir._lock.exists
+
+
+async def test_add_fmu_project_to_session_cleans_up_rms_outside_transition_lock(
+    session_manager: SessionManager,
+    tmp_path_mocked_home: Path,
+    init_project_fmu_directory: Callable[[Path], ProjectFMUDirectory],
+    mock_rms_executor: MagicMock,
+    mock_rms_project: MagicMock,
+) -> None:
+    """Tests that a slow RMS cleanup does not block project lock changes."""
+    user_fmu_dir = init_user_fmu_directory()
+    project_a = init_project_fmu_directory(tmp_path_mocked_home / "project_a")
+    project_b = init_project_fmu_directory(tmp_path_mocked_home / "project_b")
+
+    with patch("fmu_settings_api.session.session_manager", session_manager):
+        session_id = await create_fmu_session(user_fmu_dir)
+        await add_fmu_project_to_session(session_id, project_a)
+        session = await add_rms_project_to_session(
+            session_id, mock_rms_executor, mock_rms_project
+        )
+        assert session.rms_session is not None
+
+        async with session.rms_session.lock:
+            task = asyncio.create_task(
+                add_fmu_project_to_session(session_id, project_b)
+            )
+            await asyncio.sleep(0.05)
+            mock_rms_project.close.assert_not_called()
+            await asyncio.wait_for(try_acquire_project_lock(session_id), 1)
+        await task
+
+    mock_rms_project.close.assert_called_once()
+    assert project_b._lock.is_acquired()
+
+
 async def test_try_acquire_project_lock_acquires_when_not_held(
     session_manager: SessionManager,
     tmp_path_mocked_home: Path,
@@ -1155,6 +1266,79 @@ async def test_remove_rms_project_from_session_success(
     assert original_session.rms_session is None
 
 
+async def test_remove_rms_project_from_session_cleans_up_under_rms_lock(
+    session_manager: SessionManager,
+    tmp_path_mocked_home: Path,
+    init_project_fmu_directory: Callable[[Path], ProjectFMUDirectory],
+    mock_rms_executor: MagicMock,
+    mock_rms_project: MagicMock,
+    assert_off_event_loop: Callable[..., None],
+) -> None:
+    """Test that RMS cleanup waits for the session's RMS lock and runs off the loop."""
+    user_fmu_dir = init_user_fmu_directory()
+    session_id = await create_fmu_session(user_fmu_dir)
+
+    project_path = tmp_path_mocked_home / "test_project"
+    project_fmu_dir = init_project_fmu_directory(project_path)
+
+    mock_rms_project.close.side_effect = assert_off_event_loop
+
+    with (
+        patch("fmu_settings_api.session.session_manager", session_manager),
+        patch("fmu_settings_api.session.logger") as mock_logger,
+    ):
+        await add_fmu_project_to_session(session_id, project_fmu_dir)
+        await add_rms_project_to_session(
+            session_id, mock_rms_executor, mock_rms_project
+        )
+        session = await get_fmu_session(session_id)
+        assert isinstance(session, ProjectSession)
+        assert session.rms_session is not None
+        async with session.rms_session.lock:
+            task = asyncio.create_task(remove_rms_project_from_session(session_id))
+            await asyncio.sleep(0.05)
+            mock_rms_project.close.assert_not_called()
+        await task
+
+    mock_rms_project.close.assert_called_once()
+    mock_logger.error.assert_not_called()
+
+
+async def test_rms_session_run_serializes_calls() -> None:
+    """Test that concurrent calls through one RMS session never overlap."""
+    rms_session = RmsSession(
+        MagicMock(), MagicMock(), datetime.now(UTC) + timedelta(hours=1)
+    )
+    active = 0
+    max_active = 0
+    active_lock = threading.Lock()
+
+    def _call() -> None:
+        nonlocal active, max_active
+        with active_lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.01)
+        with active_lock:
+            active -= 1
+
+    await asyncio.gather(*(rms_session.run(_call) for _ in range(3)))
+
+    assert max_active == 1
+
+
+async def test_rms_session_run_does_not_wait_for_other_sessions() -> None:
+    """Test that a busy RMS session does not block calls through another one."""
+    expires_at = datetime.now(UTC) + timedelta(hours=1)
+    busy_rms_session = RmsSession(MagicMock(), MagicMock(), expires_at)
+    other_rms_session = RmsSession(MagicMock(), MagicMock(), expires_at)
+
+    async with busy_rms_session.lock:
+        result = await asyncio.wait_for(other_rms_session.run(lambda: "ok"), 1)
+
+    assert result == "ok"
+
+
 async def test_remove_rms_project_from_session_no_project_session(
     session_manager: SessionManager,
     tmp_path_mocked_home: Path,
@@ -1,8 +1,11 @@
 """Tests for the RMS routes."""
 
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
 from fmu.settings.models.project_config import RmsHorizon, RmsStratigraphicZone, RmsWell
@@ -11,16 +14,21 @@ from runrms.exceptions import RmsProjectNotFoundError, RmsVersionError
 
 from fmu_settings_api.__main__ import app
 from fmu_settings_api.deps.rms import (
-    get_opened_rms_project,
+    get_opened_rms_session,
     get_rms_project_path,
     get_rms_service,
 )
 from fmu_settings_api.deps.session import get_session_service
-from fmu_settings_api.session import SessionNotFoundError
+from fmu_settings_api.session import RmsSession, SessionNotFoundError
 
 ROUTE = "/api/v1/rms"
 
 
+def _rms_session(rms_project: MagicMock) -> RmsSession:
+    """Returns an RMS session wrapping the given mocked project."""
+    return RmsSession(MagicMock(), rms_project, datetime.now(UTC) + timedelta(hours=1))
+
+
 async def test_open_rms_project_success(
     client_with_project_session: TestClient,
 ) -> None:
@@ -420,7 +428,9 @@ async def test_get_zones_success(
     mock_service.get_zones.return_value = expected_column
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = lambda: mock_rms_project
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(
+        mock_rms_project
+    )
     app.dependency_overrides[get_rms_project_path] = lambda: Path("/path/to/rms")
 
     response = client_with_project_session.get(f"{ROUTE}/zones")
@@ -430,6 +440,68 @@ async def test_get_zones_success(
     mock_service.get_zones.assert_called_once_with(mock_rms_project)
 
 
+@pytest.mark.parametrize(
+    ("path", "service_method", "return_value"),
+    [
+        ("zones", "get_zones", []),
+        ("horizons", "get_horizons", []),
+        ("wells", "get_wells", []),
+        ("coordinate_system", "get_coordinate_system", {"name": "westeros"}),
+    ],
+)
+async def test_get_rms_data_runs_off_event_loop(
+    client_with_project_session: TestClient,
+    assert_off_event_loop: Callable[..., None],
+    path: str,
+    service_method: str,
+    return_value: object,
+) -> None:
+    """Test that blocking RMS reads are not made on the event loop thread."""
+    mock_service = MagicMock()
+
+    def _read(_: MagicMock) -> object:
+        assert_off_event_loop()
+        return return_value
+
+    getattr(mock_service, service_method).side_effect = _read
+
+    app.dependency_overrides[get_rms_service] = lambda: mock_service
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(MagicMock())
+
+    response = client_with_project_session.get(f"{ROUTE}/{path}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == return_value
+
+
+async def test_open_rms_project_runs_off_event_loop(
+    client_with_project_session: TestClient,
+    assert_off_event_loop: Callable[..., None],
+) -> None:
+    """Test that reading the version and opening the project are made off-loop."""
+    mock_service = MagicMock()
+
+    def _get_rms_version(_: Path) -> str:
+        assert_off_event_loop()
+        return "14.2.2"
+
+    def _open_rms_project(_: Path, __: str) -> tuple[MagicMock, MagicMock]:
+        assert_off_event_loop()
+        return MagicMock(), MagicMock()
+
+    mock_service.get_rms_version.side_effect = _get_rms_version
+    mock_service.open_rms_project.side_effect = _open_rms_project
+
+    app.dependency_overrides[get_rms_service] = lambda: mock_service
+    app.dependency_overrides[get_rms_project_path] = lambda: Path("/path/to/rms")
+
+    response = client_with_project_session.post(f"{ROUTE}/")
+
+    assert response.status_code == status.HTTP_200_OK
+    mock_service.get_rms_version.assert_called_once()
+    mock_service.open_rms_project.assert_called_once()
+
+
 async def test_get_zones_with_strat_columns(
     client_with_project_session: TestClient,
 ) -> None:
@@ -459,7 +531,9 @@ async def test_get_zones_with_strat_columns(
     mock_service.get_zones.return_value = expected_zones
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = lambda: mock_rms_project
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(
+        mock_rms_project
+    )
     app.dependency_overrides[get_rms_project_path] = lambda: Path("/path/to/rms")
 
     response = client_with_project_session.get(f"{ROUTE}/zones")
@@ -494,7 +568,9 @@ async def test_get_horizons_success(
     mock_service.get_horizons.return_value = expected_horizons
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = lambda: mock_rms_project
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(
+        mock_rms_project
+    )
 
     response = client_with_project_session.get(f"{ROUTE}/horizons")
 
@@ -528,7 +604,9 @@ async def test_get_wells_success(
     mock_service.get_wells.return_value = expected_wells
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = lambda: mock_rms_project
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(
+        mock_rms_project
+    )
 
     response = client_with_project_session.get(f"{ROUTE}/wells")
 
@@ -611,9 +689,7 @@ async def test_get_zones_service_error(
     mock_service.get_zones.side_effect = Exception("Service error")
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = (
-        lambda: MagicMock()  # noqa: PLW0108
-    )
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(MagicMock())
     app.dependency_overrides[get_rms_project_path] = lambda: Path("/path/to/rms")
 
     response = client_with_project_session.get(f"{ROUTE}/zones")
@@ -630,9 +706,7 @@ async def test_get_horizons_service_error(
     mock_service.get_horizons.side_effect = Exception("Service error")
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = (
-        lambda: MagicMock()  # noqa: PLW0108
-    )
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(MagicMock())
 
     response = client_with_project_session.get(f"{ROUTE}/horizons")
 
@@ -648,9 +722,7 @@ async def test_get_wells_service_error(
     mock_service.get_wells.side_effect = Exception("Service error")
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = (
-        lambda: MagicMock()  # noqa: PLW0108
-    )
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(MagicMock())
 
     response = client_with_project_session.get(f"{ROUTE}/wells")
 
@@ -668,7 +740,9 @@ async def test_get_coordinate_system_success(
     mock_service.get_coordinate_system.return_value = expected_coord_system
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = lambda: mock_rms_project
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(
+        mock_rms_project
+    )
 
     response = client_with_project_session.get(f"{ROUTE}/coordinate_system")
 
@@ -696,9 +770,7 @@ async def test_get_coordinate_system_service_error(
     mock_service.get_coordinate_system.side_effect = Exception("Service error")
 
     app.dependency_overrides[get_rms_service] = lambda: mock_service
-    app.dependency_overrides[get_opened_rms_project] = (
-        lambda: MagicMock()  # noqa: PLW0108
-    )
+    app.dependency_overrides[get_opened_rms_session] = lambda: _rms_session(MagicMock())
 
     response = client_with_project_session.get(f"{ROUTE}/coordinate_system")
 
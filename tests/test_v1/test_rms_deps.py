@@ -10,7 +10,7 @@ from runrms.api import RmsApiProxy
 from runrms.executor import ApiExecutor
 
 from fmu_settings_api.deps.rms import (
-    get_opened_rms_project,
+    get_opened_rms_session,
     get_rms_project_path,
     get_rms_service,
 )
@@ -24,6 +24,11 @@ async def test_get_rms_service() -> None:
     assert isinstance(rms_service, RmsService)
 
 
+async def test_get_rms_service_is_reused() -> None:
+    """Test that get_rms_service returns the same instance across calls."""
+    assert await get_rms_service() is await get_rms_service()
+
+
 async def test_get_rms_project_path_success() -> None:
     """Test getting RMS project path when configured."""
     expected_path = Path("/path/to/rms/project")
@@ -50,8 +55,8 @@ async def test_get_rms_project_path_not_configured() -> None:
     )
 
 
-async def test_get_opened_rms_project_success() -> None:
-    """Test getting opened RMS project refreshes the RMS session expiry."""
+async def test_get_opened_rms_session_success() -> None:
+    """Test getting opened RMS session refreshes its expiry."""
     rms_executor_mock = MagicMock(spec=ApiExecutor)
     rms_project_mock = MagicMock(spec=RmsApiProxy)
     project_session_mock = MagicMock()
@@ -71,13 +76,13 @@ async def test_get_opened_rms_project_success() -> None:
         new_callable=AsyncMock,
         return_value=refreshed_rms_session,
     ) as mock_refresh_rms_session:
-        result = await get_opened_rms_project(project_session_mock)
+        result = await get_opened_rms_session(project_session_mock)
 
-    assert result is rms_project_mock
+    assert result is refreshed_rms_session
     mock_refresh_rms_session.assert_awaited_once_with(project_session_mock)
 
 
-async def test_get_opened_rms_project_none_open() -> None:
+async def test_get_opened_rms_session_none_open() -> None:
     """Test that missing RMS project returns 400 without attempting refresh."""
     project_session_mock = MagicMock()
     project_session_mock.rms_session = None
@@ -89,7 +94,7 @@ async def test_get_opened_rms_project_none_open() -> None:
         ) as mock_refresh_rms_session,
         pytest.raises(HTTPException) as exc_info,
     ):
-        await get_opened_rms_project(project_session_mock)
+        await get_opened_rms_session(project_session_mock)
 
     assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
     assert exc_info.value.detail == (